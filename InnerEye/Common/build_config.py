@@ -4,7 +4,7 @@
 #  ------------------------------------------------------------------------------------------
 import json
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
 from InnerEye.Azure.azure_config import AzureConfig, ExperimentResultLocation
 
@@ -32,6 +32,18 @@ def build_information_to_dot_net_json(azure_config: AzureConfig, result_location
         "AzureBatchJobName": result_location.azure_job_name})
 
 
+def build_information_to_dot_net_json_stream(azure_config: AzureConfig,
+                                             result_location: ExperimentResultLocation,
+                                             stream: IO[str]) -> None:
+    """
+    Writes the build metadata as JSON to the given text stream.
+    :param azure_config: The AzureConfig that holds the build information.
+    :param result_location: ExperimentResultLocation object with result locations.
+    :param stream: A writable text stream, for example an open file or an io.StringIO object.
+    """
+    stream.write(build_information_to_dot_net_json(azure_config, result_location))
+
+
 def build_information_to_dot_net_json_file(azure_config: AzureConfig,
                                            result_location: ExperimentResultLocation,
                                            folder: Optional[Path] = None) -> None:
@@ -49,4 +61,4 @@ def build_information_to_dot_net_json_file(azure_config: AzureConfig,
 
     full_file = filename if folder is None else folder / filename
     with full_file.open("w") as f:
-        f.write(build_information_to_dot_net_json(azure_config, result_location))
+        build_information_to_dot_net_json_stream(azure_config, result_location, f)
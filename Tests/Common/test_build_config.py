@@ -2,22 +2,42 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License (MIT). See LICENSE in the repo root for license information.
 #  ------------------------------------------------------------------------------------------
+import io
+import json
+
 import pytest
 
 from InnerEye.Azure.azure_config import AzureConfig
 from InnerEye.Azure.azure_util import CROSS_VALIDATION_SPLIT_INDEX_TAG_KEY
 from InnerEye.Common.build_config import BUILDINFORMATION_JSON, ExperimentResultLocation, \
-    build_information_to_dot_net_json, build_information_to_dot_net_json_file
+    build_information_to_dot_net_json, build_information_to_dot_net_json_file, \
+    build_information_to_dot_net_json_stream
 from InnerEye.Common.output_directories import OutputFolderForTests
 from InnerEye.ML.config import SegmentationModelBase
 from InnerEye.ML.scalar_config import ScalarModelBase
 
+EXPECTED_BUILD_INFORMATION = {
+    "BuildNumber": 42,
+    "BuildRequestedFor": "user",
+    "BuildSourceBranchName": "branch",
+    "BuildSourceVersion": "00deadbeef",
+    "BuildSourceAuthor": "author",
+    "ModelName": "model",
+    "ResultsContainerName": None,
+    "ResultsUri": None,
+    "DatasetFolder": None,
+    "DatasetFolderUri": None,
+    "AzureBatchJobName": "job"
+}
+
 
-def test_build_config(test_output_dirs: OutputFolderForTests) -> None:
+@pytest.fixture(scope="module")
+def build_azure_config() -> AzureConfig:
     """
-    Test that json with build information is created correctly.
+    An AzureConfig with all build information set. The config is only read by the tests, hence it is created
+    once per module rather than once per test.
     """
-    config = AzureConfig(
+    return AzureConfig(
         build_number=42,
         build_user="user",
         build_branch="branch",
@@ -25,18 +45,31 @@ def test_build_config(test_output_dirs: OutputFolderForTests) -> None:
         build_source_author="author",
         tag="tag",
         model="model")
+
+
+def test_build_config(build_azure_config: AzureConfig) -> None:
+    """
+    Test that json with build information is created correctly.
+    """
+    config = build_azure_config
     result_location = ExperimentResultLocation(azure_job_name="job")
     net_json = build_information_to_dot_net_json(config, result_location)
-    expected = '{"BuildNumber": 42, "BuildRequestedFor": "user", "BuildSourceBranchName": "branch", ' \
-               '"BuildSourceVersion": "00deadbeef", "BuildSourceAuthor": "author", "ModelName": "model", ' \
-               '"ResultsContainerName": null, "ResultsUri": null, "DatasetFolder": null, "DatasetFolderUri": null, ' \
-               '"AzureBatchJobName": "job"}'
-    assert expected == net_json
+    assert json.loads(net_json) == EXPECTED_BUILD_INFORMATION
+    stream = io.StringIO()
+    build_information_to_dot_net_json_stream(config, result_location, stream)
+    assert json.loads(stream.getvalue()) == EXPECTED_BUILD_INFORMATION
+
+
+def test_build_config_file(test_output_dirs: OutputFolderForTests, build_azure_config: AzureConfig) -> None:
+    """
+    Test that the json file with build information is written to the given folder.
+    """
+    result_location = ExperimentResultLocation(azure_job_name="job")
     result_folder = test_output_dirs.root_dir / "buildinfo"
-    build_information_to_dot_net_json_file(config, result_location, folder=result_folder)
+    build_information_to_dot_net_json_file(build_azure_config, result_location, folder=result_folder)
     result_file = result_folder / BUILDINFORMATION_JSON
     assert result_file.exists()
-    assert result_file.read_text() == expected
+    assert json.loads(result_file.read_text()) == EXPECTED_BUILD_INFORMATION
 
 
 def test_fields_are_set() -> None: